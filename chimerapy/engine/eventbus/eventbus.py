@@ -1,4 +1,6 @@
 import asyncio
+import itertools
+import os
 import uuid
 from collections import deque
 from concurrent.futures import Future
@@ -27,11 +29,32 @@ T = TypeVar("T")
 logger = _logger.getLogger("chimerapy-engine")
 
 
+# Event ids are a per-process prefix and a counter, avoiding an urandom call
+# per event
+_EVENT_ID_PREFIX = uuid.uuid4().hex[:8]
+_event_ids = itertools.count()
+
+
+def _reseed_event_ids():
+    global _EVENT_ID_PREFIX, _event_ids
+    _EVENT_ID_PREFIX = uuid.uuid4().hex[:8]
+    _event_ids = itertools.count()
+
+
+# Forked processes (e.g. Nodes) would otherwise continue the parent's ids
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_event_ids)
+
+
+def _new_event_id() -> str:
+    return f"{_EVENT_ID_PREFIX}-{next(_event_ids)}"
+
+
 @dataclass
 class Event:
     type: str
     data: Optional[Any] = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_event_id)
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
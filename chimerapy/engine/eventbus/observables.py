@@ -13,6 +13,36 @@ class ObservableDict(dict):
         if self.callback:
             self.callback(key, None)
 
+    def pop(self, key, *args):
+        # Nothing changes if the key is missing
+        if key not in self:
+            return super().pop(key, *args)
+
+        value = super().pop(key)
+        if self.callback:
+            self.callback(key, None)
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        if self.callback:
+            self.callback(key, None)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        if self.callback:
+            self.callback(None, None)
+
     def set_callback(self, callback):
         self.callback = callback
 
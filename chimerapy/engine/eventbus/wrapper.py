@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass, fields, is_dataclass
 from typing import Any, Optional, TypeVar
 
@@ -65,11 +66,37 @@ def evented(cls):
     return cls
 
 
+def _clear_dict_cache(instance: Any, object: Optional[Any] = None):
+    instance.__dict__.pop("_dict_cache", None)
+    if object:
+        object.__dict__.pop("_dict_cache", None)
+
+
+def _cache_to_dict(cls: type):
+
+    # Cache the dict representation, as every change clears the cache. Only
+    # safe when all mutations go through the evented attributes.
+    if not hasattr(cls, "to_dict"):
+        return
+
+    def to_dict(self, encode_json=False):
+        if encode_json:
+            return super(cls, self).to_dict(encode_json=True)
+        if "_dict_cache" not in self.__dict__:
+            self.__dict__["_dict_cache"] = super(cls, self).to_dict()
+
+        # Deep copy, as callers may modify the nested dicts
+        return copy.deepcopy(self.__dict__["_dict_cache"])
+
+    cls.to_dict = to_dict  # type: ignore[attr-defined]
+
+
 def make_evented(
     instance: T,
     event_bus: "EventBus",
     event_name: Optional[str] = None,
     object: Optional[Any] = None,
+    cache_dict: bool = False,
 ) -> T:
     setattr(instance, "event_bus", event_bus)
     instance.__evented_values = {}  # type: ignore[attr-defined]
@@ -88,6 +115,7 @@ def make_evented(
 
         def setter(self, value):
             self.__evented_values[name] = value
+            _clear_dict_cache(self, object)
             if object:
                 event_data = DataClassEvent(object)
             else:
@@ -98,6 +126,7 @@ def make_evented(
         return property(getter, setter)
 
     def callback(key, value):
+        _clear_dict_cache(instance, object)
         if object:
             event_data = DataClassEvent(object)
         else:
@@ -126,6 +155,9 @@ def make_evented(
             instance.__evented_values[f.name] = attr_value  # type: ignore[attr-defined]
             setattr(NewClass, f.name, make_property(f.name))
 
+    if cache_dict:
+        _cache_to_dict(NewClass)
+
     # Change the class of the instance
     instance.__class__ = NewClass
 
@@ -1,4 +1,3 @@
-import traceback
 from concurrent.futures import Future
 from typing import Dict, List
 
@@ -124,7 +123,10 @@ class HttpServerService(Service):
             try:
                 future.result(timeout=config.get("manager.timeout.info-request"))
             except Exception:
-                logger.error(traceback.format_exc())
+                logger.error(f"{self}: Future failed", exc_info=True)
+
+        # Drop the finished futures, instead of holding onto them
+        self._futures = [f for f in self._futures if not f.done()]
 
     async def move_transferred_files(self, worker_state: WorkerState) -> bool:
         return await self._server.move_transferred_files(
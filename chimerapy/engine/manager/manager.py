@@ -82,7 +82,7 @@ class Manager:
 
         # Create eventbus
         self.eventbus = EventBus()
-        self.state = make_evented(self.state, event_bus=self.eventbus)
+        self.state = make_evented(self.state, event_bus=self.eventbus, cache_dict=True)
 
         # Create the services
         self.http_server = HttpServerService(
@@ -171,7 +171,8 @@ class Manager:
         # Submitting the coroutine
         future = self._thread.exec(coro)
 
-        # Saving the future for later use
+        # Saving the future for later use, dropping the finished ones
+        self.task_futures = [f for f in self.task_futures if not f.done()]
         self.task_futures.append(future)
 
         return future
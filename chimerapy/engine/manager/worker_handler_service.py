@@ -11,6 +11,7 @@ from typing import Any, Coroutine, Dict, List, Literal, Optional, Union
 import aiohttp
 import dill
 import networkx as nx
+import orjson
 
 from chimerapy.engine import _logger, config
 
@@ -51,7 +52,9 @@ class WorkerHandlerService(Service):
         self.commitable_graph: bool = False
         self.node_pub_table = NodePubTable()
         self.collected_workers: Dict[str, bool] = {}
-        self.http_client = aiohttp.ClientSession()
+        self.http_client = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=60)
+        )
 
         # Also create a tempfolder to store any miscellaneous files and folders
         self.tempfolder = pathlib.Path(tempfile.mkdtemp())
@@ -123,7 +126,10 @@ class WorkerHandlerService(Service):
     async def _register_worker(self, worker_state: WorkerState) -> bool:
 
         evented_worker_state = make_evented(
-            worker_state, event_bus=self.eventbus, event_name="ManagerState.changed"
+            worker_state,
+            event_bus=self.eventbus,
+            event_name="ManagerState.changed",
+            object=self.state,
         )
         self.state.workers[worker_state.id] = evented_worker_state
         logger.debug(
@@ -480,6 +486,13 @@ class WorkerHandlerService(Service):
 
         return False
 
+    async def _request_ok(
+        self, htype: Literal["get", "post"], url: str, data: bytes
+    ) -> bool:
+        # Release the response to the connection pool once read
+        async with self.http_client.request(htype.upper(), url, data=data) as resp:
+            return resp.ok
+
     async def _broadcast_request(
         self,
         htype: Literal["get", "post"],
@@ -494,38 +507,37 @@ class WorkerHandlerService(Service):
         if not self.state.workers:
             return True
 
-        # Create a new session for the moment
-        tasks: List[asyncio.Task] = []
-        for worker_data in self.state.workers.values():
-            url = f"http://{worker_data.ip}:{worker_data.port}" + route
-            if htype == "get":
-                tasks.append(
-                    asyncio.create_task(
-                        self.http_client.get(url, data=json.dumps(data))
-                    )
-                )
-            elif htype == "post":
-                tasks.append(
-                    asyncio.create_task(
-                        self.http_client.post(url, data=json.dumps(data))
-                    )
+        # Send all the requests concurrently over the shared session
+        payload = orjson.dumps(data)
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(
+                self._request_ok(
+                    htype,
+                    f"http://{worker_data.ip}:{worker_data.port}" + route,
+                    payload,
                 )
+            )
+            for worker_data in self.state.workers.values()
+        ]
 
         # Wait with a timeout
         try:
-            await asyncio.wait(tasks, timeout=timeout)
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
         except Exception:
 
             # Disregard certain exceptions
             logger.error(traceback.format_exc())
             return False
 
+        # Don't leave timed-out requests running
+        for t in pending:
+            t.cancel()
+
         # Get their outputs
         results: List[bool] = []
         for t in tasks:
             try:
-                result = t.result()
-                results.append(result.ok)
+                results.append(t.result())
             except Exception:
 
                 # Disregard certain exceptions
@@ -3,7 +3,7 @@ import asyncio
 import threading
 import traceback
 from concurrent.futures import Future
-from typing import Any, Callable, Coroutine, List, Optional, Tuple, Union
+from typing import Any, Callable, Coroutine, List, Optional, Set, Tuple, Union
 
 # Internal Imports
 from chimerapy.engine import _logger
@@ -19,6 +19,13 @@ class AsyncLoopThread(threading.Thread):
     def __init__(self):
         super().__init__(daemon=True)
         self._loop = asyncio.new_event_loop()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _schedule(self, wrapper: Coroutine):
+        # Keep a reference to the task until it finishes
+        task = self._loop.create_task(wrapper)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     def callback(
         self, func: Union[Callable, Coroutine], args: Optional[List[Any]] = None
@@ -57,7 +64,7 @@ class AsyncLoopThread(threading.Thread):
             )
 
         finished, wrapper = self.callback(coro)
-        asyncio.run_coroutine_threadsafe(wrapper, self._loop)
+        self._loop.call_soon_threadsafe(self._schedule, wrapper)
         return finished
 
     def exec_noncoro(self, callback: Callable, args: List[Any]) -> Future:
@@ -67,7 +74,7 @@ class AsyncLoopThread(threading.Thread):
             )
 
         finished, wrapper = self.callback(callback, args)
-        asyncio.run_coroutine_threadsafe(wrapper, self._loop)
+        self._loop.call_soon_threadsafe(self._schedule, wrapper)
         return finished
 
     def run(self):
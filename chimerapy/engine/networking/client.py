@@ -1,28 +1,35 @@
 # Built-in
 import asyncio
-import collections
 import enum
-import json
+import io
+import itertools
 import logging
 import os
 import pathlib
 import tempfile
 import threading
 import traceback
-import uuid
 from concurrent.futures import Future
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+from typing import IO, Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 # Third-party
 import aiohttp
-import aioshutil
 import asyncio_atexit
+import orjson
 
 # Internal Imports
 # Logging
 from chimerapy.engine import _logger, config
 
-from ..utils import async_waiting_for, create_payload
+from ..utils import (
+    BATCH_ENVELOPE_SIZE,
+    create_payload,
+    decode_payload,
+    encode_payload,
+    megabytes_to_bytes,
+    pack_frames,
+    zip_folder,
+)
 from .async_loop_thread import AsyncLoopThread
 from .enums import GENERAL_MESSAGE
 
@@ -52,6 +59,8 @@ class Client:
         self.ws_handlers = {k.value: v for k, v in ws_handlers.items()}
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self._session = None
+        self._outq: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
 
         # The EventLoop
         self._thread = thread
@@ -61,7 +70,8 @@ class Client:
         self.running = threading.Event()
         self.running.clear()
         self.msg_processed_counter = 0
-        self.uuid_records: collections.deque[str] = collections.deque(maxlen=100)
+        self._seq = itertools.count()
+        self._pending: Dict[str, asyncio.Event] = {}
         self.tasks: List[asyncio.Task] = []
 
         # Adding default client handlers
@@ -106,73 +116,146 @@ class Client:
 
     async def _ok(self, msg: Dict):
         # self.logger.debug(f"{self}: received OK")
-        self.uuid_records.append(msg["data"]["uuid"])
+        # Wake up the sender waiting on this OK
+        event = self._pending.pop(msg["data"]["uuid"], None)
+        if event:
+            event.set()
 
     ####################################################################
     # IO Main Methods
     ####################################################################
 
     async def _read_ws(self):
-        assert self._ws
+        assert self._ws and self._outq
 
         async for aiohttp_msg in self._ws:
 
             # self.logger.debug(f"{self}: msg: {aiohttp_msg}")
 
-            # Tracking the number of messages processed
-            self.msg_processed_counter += 1
-
             # Extract the binary data and decoded it
-            msg = aiohttp_msg.json()
+            msg = decode_payload(aiohttp_msg.data)
+
+            # Unpack batched messages
+            if msg["signal"] == GENERAL_MESSAGE.BATCH.value:
+                msgs = msg["data"]
+            else:
+                msgs = [msg]
+
+            for msg in msgs:
+
+                # Tracking the number of messages processed
+                self.msg_processed_counter += 1
+
+                # Select the handler
+                handler = self.ws_handlers.get(msg["signal"])
+                if handler is None:
+                    self.logger.warning(f"{self}: Unknown signal {msg['signal']}")
+                else:
+                    await handler(msg)
+
+                # Send OK if requested
+                if msg["ok"]:
+                    await self._outq.put(
+                        orjson.dumps(
+                            create_payload(
+                                GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]}, msg["uuid"]
+                            )
+                        )
+                    )
 
-            # Select the handler
-            handler = self.ws_handlers[msg["signal"]]
-            await handler(msg)
+    async def _write_ws(self):
+        assert self._ws and self._outq
 
-            # Send OK if requested
-            if msg["ok"]:
-                try:
-                    await self._ws.send_json(
-                        create_payload(GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]})
-                    )
-                except ConnectionResetError:
-                    # self.logger.warning(
-                    #     f"{self}: ConnectionResetError, shutting down ws"
-                    # )
-                    await self._ws.close()
-                    return None
+        max_batch_size = config.get("comms.ws-batch-size")
+        max_size = (
+            megabytes_to_bytes(config.get("comms.ws-max-msg-size"))
+            - BATCH_ENVELOPE_SIZE
+        )
+        carry: Optional[bytes] = None
+
+        while True:
+
+            # Wait for a message, then drain whatever else is already queued
+            # while the batch stays under the peer's frame size limit. The
+            # first message that does not fit starts the next batch
+            if carry is None:
+                frames = [await self._outq.get()]
+            else:
+                frames, carry = [carry], None
+            size = len(frames[0])
+            while len(frames) < max_batch_size and not self._outq.empty():
+                frame = self._outq.get_nowait()
+                size += len(frame) + 1
+                if size > max_size:
+                    carry = frame
+                    break
+                frames.append(frame)
+
+            # Pack multiple messages into a single frame and send it. A failed
+            # frame must not stop the writer, else later messages are lost
+            try:
+                if len(frames) == 1:
+                    await self._ws.send_bytes(frames[0])
+                else:
+                    await self._ws.send_bytes(self._batch_frame(frames))
+            except ConnectionResetError:
+                # self.logger.warning(f"{self}: ConnectionResetError, shutting down ws")
+                await self._ws.close()
+                return None
+            except Exception:
+                self.logger.error(traceback.format_exc())
+            finally:
+                for _ in frames:
+                    self._outq.task_done()
+
+    def _batch_frame(self, frames: List[bytes]) -> bytes:
+
+        # Splice the already encoded messages into the BATCH envelope
+        envelope = create_payload(
+            GENERAL_MESSAGE.BATCH, None, f"{self.id}:{next(self._seq)}"
+        )
+        return pack_frames(envelope, frames)
 
     async def _send_msg(
         self,
         signal: enum.Enum,
         data: Dict,
-        msg_uuid: str = str(uuid.uuid4()),
+        msg_uuid: Optional[str] = None,
         ok: bool = False,
-    ):
-        assert self._ws
+    ) -> bool:
+        assert self._ws and self._outq
 
         # Handle if closed
         if self._ws.closed:
-            return None
+            return False
 
-        # Create payload
+        # Create payload, encoding it here so that errors reach the caller
+        if msg_uuid is None:
+            msg_uuid = f"{self.id}:{next(self._seq)}"
         payload = create_payload(signal=signal, data=data, msg_uuid=msg_uuid, ok=ok)
+        frame = encode_payload(payload)
 
-        # Send the message
-        try:
-            await self._ws.send_json(payload)
-        except ConnectionResetError:
-            # self.logger.warning(f"{self}: ConnectionResetError, shutting down ws")
-            await self._ws.close()
-            return None
+        # Register the OK before sending, as the reply can arrive at any time
+        if ok:
+            event = asyncio.Event()
+            self._pending[msg_uuid] = event
+
+        # Queue the message for the writer
+        await self._outq.put(frame)
 
         # If ok, wait until ok
         if ok:
+            try:
+                await asyncio.wait_for(
+                    event.wait(), timeout=config.get("comms.timeout.ok")
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(f"{self}: Timeout in OK")
+                return False
+            finally:
+                self._pending.pop(msg_uuid, None)
 
-            await async_waiting_for(
-                lambda: msg_uuid in self.uuid_records,
-                timeout=config.get("comms.timeout.ok"),
-            )
+        return True
 
     async def _register(self):
 
@@ -192,16 +275,26 @@ class Client:
     async def async_connect(self) -> bool:
 
         # Reset
-        self.uuid_records.clear()
+        self._pending.clear()
 
         # Create the session
-        self._session = aiohttp.ClientSession()
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=60),
+            json_serialize=lambda x: orjson.dumps(x).decode(),
+        )
         assert self._session
-        self._ws = await self._session.ws_connect(f"http://{self.host}:{self.port}/ws")
+        self._ws = await self._session.ws_connect(
+            f"http://{self.host}:{self.port}/ws",
+            max_msg_size=megabytes_to_bytes(config.get("comms.ws-max-msg-size")),
+            compress=0,
+        )
 
-        # Create task to read
+        # Create tasks to read and write
+        self._outq = asyncio.Queue()
         task = asyncio.create_task(self._read_ws())
         self.tasks.append(task)
+        self._writer_task = asyncio.create_task(self._write_ws())
+        self.tasks.append(self._writer_task)
 
         # Register the client
         await self._register()
@@ -214,26 +307,30 @@ class Client:
     async def async_send_file(
         self, url: str, sender_id: str, filepath: pathlib.Path
     ) -> bool:
+        with open(filepath, "rb") as f:
+            return await self._post_file(
+                url, sender_id, filepath.name, f, os.path.getsize(filepath)
+            )
 
-        # Make a post request to send the file
-        data = aiohttp.FormData()
-        data.add_field(
-            "meta",
-            json.dumps({"sender_id": sender_id, "size": os.path.getsize(filepath)}),
-            content_type="application/json",
-        )
-        data.add_field(
-            "file",
-            open(filepath, "rb"),
-            filename=filepath.name,
-            content_type="application/zip",
-        )
-
-        # Create a new session for the moment
-        async with aiohttp.ClientSession() as session:
-            await session.post(url, data=data)
+    async def _post_file(
+        self, url: str, sender_id: str, filename: str, f: IO[bytes], size: int
+    ) -> bool:
 
-        return True
+        # Stream the file as a multipart body, with known part sizes aiohttp
+        # sets the Content-Length instead of buffering the whole file
+        with aiohttp.MultipartWriter("form-data") as mpwriter:
+            meta = mpwriter.append_json({"sender_id": sender_id, "size": size})
+            meta.set_content_disposition("form-data", name="meta")
+            part = mpwriter.append(f, {"Content-Type": "application/zip"})
+            part.set_content_disposition("form-data", name="file", filename=filename)
+
+            # Reuse the connected session, else create one for the moment
+            if self._session and not self._session.closed:
+                async with self._session.post(url, data=mpwriter) as resp:
+                    return resp.ok
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, data=mpwriter) as resp:
+                    return resp.ok
 
     async def async_send_folder(self, sender_id: str, dir: pathlib.Path) -> bool:
 
@@ -241,9 +338,16 @@ class Client:
             self.logger.error(f"Cannot send non-existent dir: {dir}.")
             return False
 
-        zip_file = dir.parent / f"{dir.name}.zip"
+        # Small folders are zipped in memory, skipping the temporary zip file
+        dir_size = await asyncio.to_thread(
+            lambda: sum(f.stat().st_size for f in dir.rglob("*") if f.is_file())
+        )
+        max_size = megabytes_to_bytes(config.get("comms.in-memory-zip-size"))
+        zip_file: Union[pathlib.Path, io.BytesIO] = (
+            io.BytesIO() if dir_size <= max_size else dir.parent / f"{dir.name}.zip"
+        )
         try:
-            await aioshutil.make_archive(str(dir), "zip", dir.parent, dir.name)
+            await asyncio.to_thread(zip_folder, dir, zip_file)
         except Exception:
             self.logger.warning(f"{self}: Temp folder couldn't be zipped.")
             self.logger.error(traceback.format_exc())
@@ -253,10 +357,25 @@ class Client:
         url = f"http://{self.host}:{self.port}/file/post"
 
         # Then send the file
+        if isinstance(zip_file, io.BytesIO):
+            size = zip_file.getbuffer().nbytes
+            zip_file.seek(0)
+            return await self._post_file(
+                url, sender_id, f"{dir.name}.zip", zip_file, size
+            )
         return await self.async_send_file(url, sender_id, zip_file)
 
     async def async_shutdown(self, msg: Dict = {}):
 
+        # Flush the outbound messages before closing
+        if self._ws and not self._ws.closed and self._outq:
+            try:
+                await asyncio.wait_for(self._outq.join(), timeout=5)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"{self}: Timeout in flushing outbound messages")
+
+        if self._writer_task:
+            self._writer_task.cancel()
         if self._ws:
             await asyncio.wait_for(self._ws.close(), timeout=5)
         if self._session:
@@ -264,21 +383,21 @@ class Client:
 
     async def async_send(self, signal: enum.Enum, data: Any, ok: bool = False) -> bool:
 
-        # Create uuid
-        msg_uuid = str(uuid.uuid4())
-
         # Create msg container and execute writing coroutine
-        msg = {"signal": signal, "data": data, "msg_uuid": msg_uuid, "ok": ok}
-        await self._send_msg(**msg)
+        msg = {"signal": signal, "data": data, "ok": ok}
+        return await self._send_msg(**msg)
 
-        if ok:
+    async def async_send_batch(
+        self, msgs: List[Tuple[enum.Enum, Any]], ok: bool = False
+    ) -> bool:
 
-            success = await async_waiting_for(
-                lambda: msg_uuid in self.uuid_records,
-                timeout=config.get("comms.timeout.ok"),
-            )
-            if not success:
-                self.logger.warning(f"{self}: Timeout in OK")
+        # Queue all the messages without yielding, so that the writer packs
+        # them into the same frame. As messages are processed in order, only
+        # the last one needs to be OK'ed
+        for i, (signal, data) in enumerate(msgs):
+            last = i == len(msgs) - 1
+            if not await self._send_msg(signal=signal, data=data, ok=ok and last):
+                return False
 
         return True
 
@@ -289,6 +408,11 @@ class Client:
     def send(self, signal: enum.Enum, data: Any, ok: bool = False) -> Future[bool]:
         return self._exec_coro(self.async_send(signal, data, ok))
 
+    def send_batch(
+        self, msgs: List[Tuple[enum.Enum, Any]], ok: bool = False
+    ) -> Future[bool]:
+        return self._exec_coro(self.async_send_batch(msgs, ok))
+
     def send_file(self, sender_id: str, filepath: pathlib.Path) -> Future[bool]:
         # Compose the url
         url = f"http://{self.host}:{self.port}/file/post"
@@ -3,6 +3,7 @@ from enum import Enum
 
 # Server <--> Client
 class GENERAL_MESSAGE(Enum):  # Used only Client and Server
+    BATCH = -2
     SHUTDOWN = -1
     OK = 0
     FILE_TRANSFER_START = 1
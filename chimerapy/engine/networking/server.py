@@ -1,8 +1,7 @@
 # Built-in
 import asyncio
-import collections
 import enum
-import json
+import itertools
 import logging
 import pathlib
 import tempfile
@@ -10,12 +9,13 @@ import traceback
 import uuid
 from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Callable, Coroutine, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
 
 import aiofiles
 import aioshutil
 import asyncio_atexit
-from aiohttp import web
+import orjson
+from aiohttp import WSMsgType, web
 
 # Third-party
 from tqdm import tqdm
@@ -24,9 +24,14 @@ from tqdm import tqdm
 # Logging
 from chimerapy.engine import _logger, config
 from chimerapy.engine.utils import (
-    async_waiting_for,
+    BATCH_ENVELOPE_SIZE,
     create_payload,
+    decode_payload,
+    encode_payload,
     get_ip_address,
+    megabytes_to_bytes,
+    pack_frames,
+    split_frames,
 )
 
 from .async_loop_thread import AsyncLoopThread
@@ -92,6 +97,8 @@ class Server:
         # Using flag for marking if system should be running
         self.running: bool = False
         self.msg_processed_counter = 0
+        self._seq = itertools.count()
+        self._pending: Dict[str, asyncio.Event] = {}
 
         # Create AIOHTTP server
         self._app = web.Application()
@@ -101,6 +108,7 @@ class Server:
 
         # Creating container for ws clients
         self.ws_clients: Dict[str, web.WebSocketResponse] = {}
+        self._binary_ws: Set[web.WebSocketResponse] = set()
 
         # Adding unique routes
         if self.routes:
@@ -185,7 +193,7 @@ class Server:
         field = await reader.next()
         assert field.name == "meta"
         meta_bytes = await field.read(decode=True)
-        meta = json.loads(meta_bytes)
+        meta = orjson.loads(meta_bytes)
 
         # Get the "file" field
         field = await reader.next()
@@ -248,7 +256,10 @@ class Server:
     ####################################################################
 
     async def _ok(self, msg: Dict, ws: web.WebSocketResponse):
-        self.uuid_records.append(msg["data"]["uuid"])
+        # Wake up the sender waiting on this OK
+        event = self._pending.pop(msg["data"]["uuid"], None)
+        if event:
+            event.set()
 
     async def _register_ws_client(self, msg: Dict, ws: web.WebSocketResponse):
         # self.logger.debug(f"{self}: reigstered client: {msg['data']['client_id']}")
@@ -268,41 +279,73 @@ class Server:
 
         return success
 
+    async def _send_bytes(self, ws: web.WebSocketResponse, data: bytes):
+
+        # Reply with binary frames (no UTF-8 validation) to peers that use
+        # them, e.g. ``Client``, and with text frames to the rest
+        if ws in self._binary_ws:
+            await ws.send_bytes(data)
+        else:
+            await ws.send_str(data.decode())
+
+    async def _dispatch_msg(self, msg: Dict, ws: web.WebSocketResponse):
+
+        # Tracking the number of messages processed
+        self.msg_processed_counter += 1
+
+        # Select the handler
+        handler = self.ws_handlers.get(msg["signal"])
+        if handler is None:
+            self.logger.warning(f"{self}: Unknown signal {msg['signal']}")
+        else:
+            await handler(msg, ws)
+
+        # self.logger.debug(f"{self}: after handler")
+
+        # Send OK if requested
+        if msg["ok"]:
+            try:
+                # self.logger.debug(f"{self}: sending OK")
+                await self._send_bytes(
+                    ws,
+                    orjson.dumps(
+                        create_payload(
+                            GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]}, msg["uuid"]
+                        )
+                    ),
+                )
+            except ConnectionResetError:
+                self.logger.warning(f"{self}: ConnectionResetError, shutting down ws")
+                await ws.close()
+
     async def _websocket_handler(self, request):
 
         # self.logger.debug("Obtain WS connection")
 
         # Register new client
-        ws = web.WebSocketResponse()
+        ws = web.WebSocketResponse(
+            max_msg_size=megabytes_to_bytes(config.get("comms.ws-max-msg-size"))
+        )
         await ws.prepare(request)
 
         try:
             async for aiohttp_msg in ws:
 
-                # Tracking the number of messages processed
-                self.msg_processed_counter += 1
+                # Track the frame type used by the peer
+                if aiohttp_msg.type == WSMsgType.BINARY:
+                    self._binary_ws.add(ws)
 
                 # Extract the binary data and decoded it
-                msg = aiohttp_msg.json()
+                msg = decode_payload(aiohttp_msg.data)
 
-                # Select the handler
-                handler = self.ws_handlers[msg["signal"]]
-                await handler(msg, ws)
+                # Unpack batched messages
+                if msg["signal"] == GENERAL_MESSAGE.BATCH.value:
+                    msgs = msg["data"]
+                else:
+                    msgs = [msg]
 
-                # self.logger.debug(f"{self}: after handler")
-
-                # Send OK if requested
-                if msg["ok"]:
-                    try:
-                        # self.logger.debug(f"{self}: sending OK")
-                        await ws.send_json(
-                            create_payload(GENERAL_MESSAGE.OK, {"uuid": msg["uuid"]})
-                        )
-                    except ConnectionResetError:
-                        self.logger.warning(
-                            f"{self}: ConnectionResetError, shutting down ws"
-                        )
-                        await ws.close()
+                for msg in msgs:
+                    await self._dispatch_msg(msg, ws)
 
         except Exception:
             self.logger.warning(traceback.format_exc())
@@ -311,6 +354,7 @@ class Server:
 
             # Close websocket
             await ws.close()
+            self._binary_ws.discard(ws)
 
             # Remove client id
             target_client_id: Optional[str] = None
@@ -327,13 +371,33 @@ class Server:
     # Server Utilities
     ####################################################################
 
+    async def _send_frame(
+        self, ws: web.WebSocketResponse, client_id: str, frame: bytes
+    ) -> bool:
+
+        # First, check if the ws is still open
+        if ws.closed:
+            self.ws_clients.pop(client_id, None)
+            return True
+
+        # Send the encoded message
+        try:
+            await self._send_bytes(ws, frame)
+        except ConnectionResetError:
+            self.logger.warning(f"{self}: ConnectionResetError, shutting down ws")
+            await ws.close()
+            self.ws_clients.pop(client_id, None)
+            return False
+
+        return True
+
     async def _send_msg(
         self,
         ws: web.WebSocketResponse,
         client_id: str,
         signal: enum.Enum,
         data: Dict,
-        msg_uuid: str = str(uuid.uuid4()),
+        msg_uuid: Optional[str] = None,
         ok: bool = False,
     ) -> bool:
 
@@ -343,23 +407,44 @@ class Server:
             return True
 
         # Create payload
+        if msg_uuid is None:
+            msg_uuid = f"{self.id}:{next(self._seq)}"
         payload = create_payload(signal=signal, data=data, msg_uuid=msg_uuid, ok=ok)
 
+        return await self._send_payload(
+            ws, client_id, encode_payload(payload), msg_uuid if ok else None
+        )
+
+    async def _send_payload(
+        self,
+        ws: web.WebSocketResponse,
+        client_id: str,
+        frame: bytes,
+        ok_uuid: Optional[str] = None,
+    ) -> bool:
+
+        # Register the OK before sending, as the reply can arrive at any time
+        if ok_uuid:
+            event = asyncio.Event()
+            self._pending[ok_uuid] = event
+
         # Send the message
-        try:
-            await ws.send_json(payload)
-        except ConnectionResetError:
-            self.logger.warning(f"{self}: ConnectionResetError, shutting down ws")
-            await ws.close()
-            del self.ws_clients[client_id]
+        if not await self._send_frame(ws, client_id, frame):
+            if ok_uuid:
+                self._pending.pop(ok_uuid, None)
             return False
 
         # If ok, wait until ok
-        if ok:
-            await async_waiting_for(
-                lambda: msg_uuid in self.uuid_records,
-                timeout=config.get("comms.timeout.ok"),
-            )
+        if ok_uuid:
+            try:
+                await asyncio.wait_for(
+                    event.wait(), timeout=config.get("comms.timeout.ok")
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(f"{self}: Timeout in OK")
+                return False
+            finally:
+                self._pending.pop(ok_uuid, None)
 
         return True
 
@@ -369,9 +454,6 @@ class Server:
 
     async def async_serve(self) -> bool:
 
-        # Create record of message uuids
-        self.uuid_records: collections.deque[str] = collections.deque(maxlen=100)
-
         # Use an application runner to run the web server
         self._runner = web.AppRunner(self._app)
         await self._runner.setup()
@@ -394,24 +476,87 @@ class Server:
         self, client_id: str, signal: enum.Enum, data: Dict, ok: bool = False
     ) -> bool:
 
-        # Create uuid
-        msg_uuid = str(uuid.uuid4())
-
         # Create msg container and execute writing coroutine
-        msg = {"signal": signal, "data": data, "msg_uuid": msg_uuid, "ok": ok}
+        msg = {"signal": signal, "data": data, "ok": ok}
         success = await self._write_ws(client_id, msg)
         return success
 
+    async def async_send_batch(
+        self, client_id: str, msgs: List[Tuple[enum.Enum, Any]], ok: bool = False
+    ) -> bool:
+
+        if client_id not in self.ws_clients:
+            return False
+        elif not msgs:
+            return True
+
+        ws = self.ws_clients[client_id]
+        if ws.closed:
+            del self.ws_clients[client_id]
+            return True
+
+        # Only Client peers (binary frames) unpack batches, the rest (e.g.
+        # the front-end) get the messages one by one. As messages are
+        # processed in order, only the last one needs to be OK'ed
+        if ws not in self._binary_ws:
+            for i, (signal, data) in enumerate(msgs):
+                last = i == len(msgs) - 1
+                if not await self._send_msg(
+                    ws, client_id, signal, data, ok=ok and last
+                ):
+                    return False
+            return True
+
+        # Pack the messages into as few frames as fit in the peer's frame
+        # size limit
+        payloads = [
+            create_payload(
+                signal=signal, data=data, msg_uuid=f"{self.id}:{next(self._seq)}"
+            )
+            for signal, data in msgs
+        ]
+        payloads[-1]["ok"] = ok
+        max_size = (
+            megabytes_to_bytes(config.get("comms.ws-max-msg-size"))
+            - BATCH_ENVELOPE_SIZE
+        )
+        groups = split_frames([encode_payload(p) for p in payloads], max_size)
+
+        for i, frames in enumerate(groups):
+            if len(frames) == 1:
+                frame = frames[0]
+            else:
+                batch = create_payload(
+                    GENERAL_MESSAGE.BATCH, None, f"{self.id}:{next(self._seq)}"
+                )
+                frame = pack_frames(batch, frames)
+
+            last = i == len(groups) - 1
+            ok_uuid = payloads[-1]["uuid"] if ok and last else None
+            if not await self._send_payload(ws, client_id, frame, ok_uuid):
+                return False
+
+        return True
+
     async def async_broadcast(
         self, signal: enum.Enum, data: Dict, ok: bool = False
     ) -> bool:
 
-        # Create msg container and execute writing coroutine for all
-        # clients
-        msg = {"signal": signal, "data": data, "ok": ok}
         coros = []
-        for client_id in self.ws_clients:
-            coros.append(self._write_ws(client_id, msg))
+        if ok:
+            # Create msg container and execute writing coroutine for all
+            # clients, each gets its own id to track their OK
+            for client_id in self.ws_clients:
+                msg = {"signal": signal, "data": data, "ok": ok}
+                coros.append(self._write_ws(client_id, msg))
+        else:
+            # Encode once and send the same frame to all clients
+            payload = create_payload(
+                signal=signal, data=data, msg_uuid=f"{self.id}:{next(self._seq)}"
+            )
+            frame = encode_payload(payload)
+            for client_id, ws in list(self.ws_clients.items()):
+                coros.append(self._send_frame(ws, client_id, frame))
 
         # Wait until all complete
         try:
@@ -478,6 +623,11 @@ class Server:
     ) -> Future[bool]:
         return self._exec_coro(self.async_send(client_id, signal, data, ok))
 
+    def send_batch(
+        self, client_id: str, msgs: List[Tuple[enum.Enum, Any]], ok: bool = False
+    ) -> Future[bool]:
+        return self._exec_coro(self.async_send_batch(client_id, msgs, ok))
+
     def broadcast(
         self, signal: enum.Enum, data: Dict, ok: bool = False
     ) -> Future[bool]:
@@ -177,7 +177,8 @@ class Node:
             wrapper, future = future_wrapper(coro)
             task = loop.create_task(wrapper)
 
-        # Saving the future for later use
+        # Saving the future for later use, dropping the finished ones
+        self.task_futures = [f for f in self.task_futures if not f.done()]
         self.task_futures.append(future)
 
         return future, task
@@ -431,7 +432,7 @@ class Node:
             raise RuntimeError(f"{self}: logdir {self.state.logdir} not set!")
 
         # Make the state evented
-        self.state = make_evented(self.state, event_bus=self.eventbus)
+        self.state = make_evented(self.state, event_bus=self.eventbus, cache_dict=True)
 
         # Add the FSM service
         self.fsm_service = FSMService("fsm", self.state, self.eventbus, self.logger)
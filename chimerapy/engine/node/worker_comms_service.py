@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import pathlib
 import tempfile
@@ -57,6 +58,7 @@ class WorkerCommsService(Service):
         # Internal state variables
         self.running: bool = False
         self.client: Optional[Client] = None
+        self._state_pending: bool = False
 
     async def async_init(self):
 
@@ -128,7 +130,7 @@ class WorkerCommsService(Service):
         await self.client.async_connect()
 
         # Send publisher port and host information
-        await self.send_state()
+        await self._send_state()
 
     async def teardown(self):
 
@@ -142,6 +144,17 @@ class WorkerCommsService(Service):
     ####################################################################
 
     async def send_state(self):
+
+        # Coalesce a burst of state changes into a single send per loop tick
+        if self._state_pending:
+            return
+        self._state_pending = True
+        await asyncio.sleep(0)
+        self._state_pending = False
+
+        await self._send_state()
+
+    async def _send_state(self):
         assert self.state and self.eventbus and self.logger
 
         # Save container informaiton
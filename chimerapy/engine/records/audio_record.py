@@ -11,6 +11,10 @@ from .record import Record
 
 
 class AudioRecord(Record):
+
+    # Bytes of frames accumulated before writing them to the file
+    FLUSH_SIZE: int = 256 * 1024
+
     def __init__(
         self,
         dir: pathlib.Path,
@@ -24,6 +28,7 @@ class AudioRecord(Record):
         self.first_frame = True
         self.audio_file_path = self.dir / f"{self.name}.wav"
         self.audio_writer = wave.open(str(self.audio_file_path), "wb")
+        self.buffer = bytearray()
 
     def write(self, data_chunk: Dict[str, Any]):
 
@@ -59,9 +64,20 @@ class AudioRecord(Record):
             if recorder_version == 1
             else data_chunk["data"]
         )
-        self.audio_writer.writeframes(prepped_data)
+        self.buffer += prepped_data
+
+        # Each writeframes also patches the WAV header, so write in batches
+        if len(self.buffer) >= self.FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+
+        if self.buffer:
+            self.audio_writer.writeframes(self.buffer)
+            self.buffer.clear()
 
     def close(self):
 
-        # Close the audio writer
+        # Write the remaining frames and close the audio writer
+        self.flush()
         self.audio_writer.close()
@@ -3,14 +3,19 @@ import datetime
 import enum
 import errno
 import json
+import os
+import pathlib
 import queue
 import socket
 import time
 import uuid
+import zipfile
 from concurrent.futures import Future
-from typing import Any, Callable, Coroutine, Dict, Optional, Tuple, Union
+from typing import IO, Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 # Third-party
+import orjson
+
 # Internal
 from chimerapy.engine import _logger
 
@@ -18,6 +23,9 @@ logger = _logger.getLogger("chimerapy-engine")
 
 BYTES_PER_MB = 1024 * 1024
 
+# Room left in a batched WS frame for its envelope (signal, timestamp, uuid...)
+BATCH_ENVELOPE_SIZE = 1024
+
 
 def clear_queue(input_queue: queue.Queue):
     """Clear a queue.
@@ -144,27 +152,104 @@ def get_ip_address() -> str:
     return ip
 
 
+# Timestamp of payloads created without one
+NULL_TIMESTAMP = str(datetime.timedelta())
+
+
 def create_payload(
     signal: enum.Enum,
     data: Any,
-    msg_uuid: str = str(uuid.uuid4()),
-    timestamp: datetime.timedelta = datetime.timedelta(),
+    msg_uuid: Optional[str] = None,
+    timestamp: Optional[datetime.timedelta] = None,
     ok: bool = False,
 ) -> Dict[str, Any]:
 
-    payload = {
+    if msg_uuid is None:
+        msg_uuid = str(uuid.uuid4())
+
+    return {
         "signal": signal.value,
-        "timestamp": str(timestamp),
+        "timestamp": NULL_TIMESTAMP if timestamp is None else str(timestamp),
         "data": data,
         "uuid": msg_uuid,
         "ok": ok,
     }
 
-    return payload
 
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    try:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson rejects some data that json accepts, e.g. integers above 64 bits
+        return json.dumps(payload).encode()
+
+
+def pack_frames(envelope: Dict[str, Any], frames: List[bytes]) -> bytes:
+    """Encode a payload with already encoded payloads as its data.
+
+    Args:
+        envelope (Dict[str, Any]): Payload with ``None`` as its data.
+        frames (List[bytes]): Encoded payloads, spliced in without decoding.
+
+    Returns:
+        bytes: The encoded payload.
+
+    """
+    return orjson.dumps(envelope).replace(
+        b'"data":null', b'"data":[' + b",".join(frames) + b"]", 1
+    )
+
+
+def split_frames(frames: List[bytes], max_size: int) -> List[List[bytes]]:
+    """Group encoded payloads so that each group fits in ``max_size`` bytes.
+
+    A payload larger than ``max_size`` gets a group of its own.
 
-def decode_payload(data: str) -> Dict[str, Any]:
-    return json.loads(data)
+    Args:
+        frames (List[bytes]): Encoded payloads, in order.
+        max_size (int): Maximum total size of a group in bytes.
+
+    Returns:
+        List[List[bytes]]: The groups, in order.
+
+    """
+    groups: List[List[bytes]] = []
+    size = 0
+    for frame in frames:
+        if not groups or size + len(frame) > max_size:
+            groups.append([])
+            size = 0
+        groups[-1].append(frame)
+        size += len(frame) + 1  # separator
+
+    return groups
+
+
+def decode_payload(data: Union[str, bytes]) -> Dict[str, Any]:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Frames from the json fallback can contain NaN or integers above 64 bits
+        return json.loads(data)
+
+
+def zip_folder(dir: pathlib.Path, dst: Union[pathlib.Path, IO[bytes]]):
+    """Archive a folder, with the folder itself as the root of the archive.
+
+    The files are stored without compression, as recorded data is mostly
+    already compressed media.
+
+    Args:
+        dir (pathlib.Path): The folder to archive.
+        dst (Union[pathlib.Path, IO[bytes]]): The zip filepath or file object.
+
+    """
+    with zipfile.ZipFile(dst, "w", compression=zipfile.ZIP_STORED) as zip_file:
+        zip_file.write(dir, dir.name)
+        for root, dirs, files in os.walk(dir):
+            for name in dirs + files:
+                path = pathlib.Path(root) / name
+                zip_file.write(path, path.relative_to(dir.parent))
 
 
 def megabytes_to_bytes(megabytes: int) -> int:
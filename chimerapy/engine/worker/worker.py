@@ -170,7 +170,8 @@ class Worker:
         # Submitting the coroutine
         future = self._thread.exec(coro)
 
-        # Saving the future for later use
+        # Saving the future for later use, dropping the finished ones
+        self.task_futures = [f for f in self.task_futures if not f.done()]
         self.task_futures.append(future)
 
         return future
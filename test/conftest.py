@@ -52,6 +52,10 @@ def pytest_configure():
         logger.disabled = True
         logger.propagate = False
 
+    # Debug logging is opt-in, as it slows down the message-heavy tests
+    if os.environ.get("CHIMERAPY_ENGINE_TEST_DEBUG"):
+        cpe.debug()
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -72,7 +76,7 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def logreceiver():
     listener = cpe._logger.get_node_id_zmq_listener()
     listener.start()
@@ -9,7 +9,6 @@ from ..conftest import TEST_DATA_DIR, ConsumeNode, GenNode
 from ..utils import uuid
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 pytestmark = [pytest.mark.slow]
 
@@ -13,7 +13,7 @@ logger = cpe._logger.getLogger("chimerapy-engine")
 
 # Constant
 TEST_DIR = pathlib.Path(os.path.abspath(__file__)).parent.parent
-TEST_PACKAGE_DIR = TEST_DIR / "MOCK"
+TEST_PACKAGE_DIR = TEST_DIR / "mock"
 
 
 @pytest.fixture
@@ -23,25 +23,6 @@ def local_node_graph(gen_node):
     return graph
 
 
-@pytest.fixture
-def packaged_node_graph():
-    # Installing test package (in case this test package hasn't been done before)
-    # Reference: https://stackoverflow.com/a/55188705/13231446
-    try:
-        import test_package as tp
-    except ImportError:
-        import pip._internal as pip
-
-        pip.main(["install", str(TEST_PACKAGE_DIR)])
-    finally:
-        import test_package as tp
-
-    node = tp.TestNode(name="test")
-    graph = cpe.Graph()
-    graph.add_node(node)
-    return graph
-
-
 @pytest.fixture
 async def manager_with_worker():
     manager = cpe.Manager(logdir=TEST_DATA_DIR, port=0)
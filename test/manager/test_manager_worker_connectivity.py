@@ -10,7 +10,7 @@ logger = cpe._logger.getLogger("chimerapy-engine")
 
 # Constant
 TEST_DIR = pathlib.Path(os.path.abspath(__file__)).parent.parent
-TEST_PACKAGE_DIR = TEST_DIR / "MOCK"
+TEST_PACKAGE_DIR = TEST_DIR / "mock"
 
 
 async def test_manager_instance(manager):
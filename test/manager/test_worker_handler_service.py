@@ -2,6 +2,7 @@ import asyncio
 import pathlib
 import tempfile
 
+import dill
 import pytest
 
 import chimerapy.engine as cpe
@@ -14,11 +15,10 @@ from chimerapy.engine.states import ManagerState
 from ..conftest import ConsumeNode, GenNode
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 
-@pytest.fixture
-async def testbed_setup():
+@pytest.fixture(scope="module")
+async def testbed():
 
     # Creating worker to communicate
     worker = cpe.Worker(name="local", id="local", port=0)
@@ -61,6 +61,17 @@ async def testbed_setup():
     await worker.async_shutdown()
 
 
+@pytest.fixture
+async def testbed_setup(testbed):
+
+    # Share the Manager services and Worker across the module, only clearing
+    # the Nodes and graph left by the previous test
+    worker_handler, _, _ = testbed
+    assert await worker_handler.reset()
+
+    yield testbed
+
+
 async def test_instanticate(testbed_setup):
     ...
 
@@ -110,6 +121,21 @@ async def test_worker_handler_create_connections(testbed_setup):
     assert await worker_handler.reset()
 
 
+async def test_worker_handler_register_mutated_graph(testbed_setup):
+    worker_handler, _, _ = testbed_setup
+
+    gen_node = GenNode(name="Gen1", id="Gen1")
+    graph = cpe.Graph()
+    graph.add_nodes_from([gen_node])
+    worker_handler._register_graph(graph)
+
+    # Guards against caching Node dumps across registrations: Workers must
+    # receive the Node as it is when the graph is (re-)registered
+    gen_node.value = 5
+    worker_handler._register_graph(graph)
+    assert dill.loads(worker_handler.graph_dumps["Gen1"]).value == 5
+
+
 async def test_worker_handler_lifecycle_graph(testbed_setup):
     worker_handler, worker, simple_graph = testbed_setup
 
@@ -120,8 +146,13 @@ async def test_worker_handler_lifecycle_graph(testbed_setup):
         graph=worker_handler.graph, mapping={worker.id: ["Gen1", "Con1"]}
     )
     assert await worker_handler.start_workers()
-
-    await asyncio.sleep(1)
+    assert await cpe.utils.async_waiting_for(
+        lambda: all(
+            worker.state.nodes[node_id].fsm == "PREVIEWING"
+            for node_id in ["Gen1", "Con1"]
+        ),
+        timeout=5,
+    )
 
     assert await worker_handler.stop()
     assert await worker_handler.collect()
@@ -136,6 +167,9 @@ async def test_worker_handler_enable_diagnostics(testbed_setup):
     config.set("diagnostics.interval", 2)
     config.set("diagnostics.logging-enabled", True)
 
+    # Use a fresh logdir, as the shared one has the previous tests' sessions
+    worker_handler.state.logdir = pathlib.Path(tempfile.mkdtemp())
+
     # Register graph
     worker_handler._register_graph(simple_graph)
 
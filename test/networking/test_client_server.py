@@ -2,18 +2,20 @@ import asyncio
 import enum
 import os
 import pathlib
+import shutil
 import tempfile
-from typing import Dict
+from typing import Dict, List
 
 import aiohttp
 import pytest
 from aiohttp import web
 
 import chimerapy.engine as cpe
+from chimerapy.engine import config
 from chimerapy.engine.networking import Client, Server
+from chimerapy.engine.networking.enums import GENERAL_MESSAGE
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 # Constants
 TEST_DIR = pathlib.Path(os.path.abspath(__file__)).parent.parent
@@ -59,24 +61,45 @@ async def client(server):
     await client.async_shutdown()
 
 
+@pytest.fixture
+def recorded_msgs(server):
+    # Record the ECHO messages received by the server
+    msgs: List[Dict] = []
+
+    async def record(msg: Dict, ws: web.WebSocketResponse = None):
+        msgs.append(msg)
+
+    server.ws_handlers[TEST_PROTOCOL.ECHO_FLAG.value] = record
+    return msgs
+
+
+@pytest.fixture
+def small_ws_max_msg_size():
+    max_msg_size = config.get("comms.ws-max-msg-size")
+    config.set("comms.ws-max-msg-size", 1)  # MB
+    yield
+    config.set("comms.ws-max-msg-size", max_msg_size)
+
+
 @pytest.fixture
 async def client_list(server):
 
-    clients = []
-    for i in range(NUMBER_OF_CLIENTS):
-        client = Client(
+    clients = [
+        Client(
             host=server.host,
             port=server.port,
             id=f"test-{i}",
             ws_handlers={TEST_PROTOCOL.ECHO_FLAG: echo},
         )
-        await client.async_connect()
-        clients.append(client)
+        for i in range(NUMBER_OF_CLIENTS)
+    ]
+
+    # Connect the clients concurrently
+    await asyncio.gather(*[client.async_connect() for client in clients])
 
     yield clients
 
-    for client in clients:
-        await client.async_shutdown()
+    await asyncio.gather(*[client.async_shutdown() for client in clients])
 
 
 async def test_server_instanciate(server):
@@ -118,50 +141,154 @@ async def test_server_send_to_client(server, client):
         client_id=client.id, signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO"
     )
 
-    # Simple send with OK
-    await server.async_send(
+    # Simple send with OK, messages are handled in order before the OK
+    assert await server.async_send(
         client_id=client.id, signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO", ok=True
     )
-
-    assert await cpe.utils.async_waiting_for(
-        lambda: client.msg_processed_counter >= 2,
-        timeout=2,
-    )
+    assert client.msg_processed_counter >= 2
 
 
 async def test_client_send_to_server(server, client):
     # Simple send
     await client.async_send(signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO")
 
-    # Simple send with OK
-    await client.async_send(signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO", ok=True)
+    # Simple send with OK, messages are handled in order before the OK
+    assert await client.async_send(
+        signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO", ok=True
+    )
+    assert server.msg_processed_counter >= 2
+
+
+async def test_client_burst_send_to_server(server, client):
+    # Burst of messages, packed into batched frames by the writer
+    for _ in range(50):
+        await client.async_send(signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO")
+
+    # Simple send with OK, messages are handled in order before the OK
+    assert await client.async_send(
+        signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO", ok=True
+    )
+    assert server.msg_processed_counter >= 51
+
+
+async def test_client_burst_over_max_msg_size(small_ws_max_msg_size, server, client):
+    # Queued messages that together exceed the frame size limit are split
+    # across several frames instead of one oversized batch
+    data = "x" * 300_000
+    for _ in range(5):
+        await client.async_send(signal=TEST_PROTOCOL.ECHO_FLAG, data=data)
+
+    assert await client.async_send(
+        signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO", ok=True
+    )
+    assert server.msg_processed_counter >= 6
+
+
+async def test_server_send_batch_over_max_msg_size(
+    small_ws_max_msg_size, server, client
+):
+    msgs = [(TEST_PROTOCOL.ECHO_FLAG, "x" * 300_000) for _ in range(5)]
+    assert await server.async_send_batch(client.id, msgs, ok=True)
+    assert client.msg_processed_counter >= 5
+
+
+async def test_client_send_bad_payload_to_server(server, client):
+    # Encoding errors reach the caller instead of killing the writer
+    with pytest.raises(TypeError):
+        await client.async_send(signal=TEST_PROTOCOL.ECHO_FLAG, data=object())
+
+    # Later messages still go through
+    assert await client.async_send(
+        signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO", ok=True
+    )
+
 
-    assert await cpe.utils.async_waiting_for(
-        lambda: server.msg_processed_counter >= 2,
-        timeout=2,
+async def test_client_send_non_orjson_payload_to_server(server, client, recorded_msgs):
+
+    # Non-str keys and integers above 64 bits, which json accepts
+    assert await client.async_send(
+        signal=TEST_PROTOCOL.ECHO_FLAG, data={"output": {1: "a"}}, ok=True
+    )
+    assert await client.async_send(
+        signal=TEST_PROTOCOL.ECHO_FLAG, data={"output": 2**70}, ok=True
     )
+    assert recorded_msgs[0]["data"] == {"output": {"1": "a"}}
+    assert len(recorded_msgs) == 2
+
+
+async def test_client_send_batch_to_server(server, client):
+    msgs = [(TEST_PROTOCOL.ECHO_FLAG, f"HELLO-{i}") for i in range(20)]
+    assert await client.async_send_batch(msgs, ok=True)
+    assert server.msg_processed_counter >= 20
+
+
+async def test_server_send_batch_to_client(server, client):
+    msgs = [(TEST_PROTOCOL.ECHO_FLAG, f"HELLO-{i}") for i in range(20)]
+    assert await server.async_send_batch(client.id, msgs, ok=True)
+    assert client.msg_processed_counter >= 20
+
+
+async def test_server_send_batch_to_text_peer(server):
+    # Peers using text frames, e.g. the front-end, are not sent BATCH frames
+    url = f"http://{server.host}:{server.port}/ws"
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(url) as ws:
+            await ws.send_json(
+                {
+                    "signal": GENERAL_MESSAGE.CLIENT_REGISTER.value,
+                    "data": {"client_id": "text_peer"},
+                    "uuid": "text_peer:0",
+                    "ok": False,
+                }
+            )
+            assert await cpe.utils.async_waiting_for(
+                lambda: "text_peer" in server.ws_clients, timeout=5
+            )
+
+            msgs = [(TEST_PROTOCOL.ECHO_FLAG, f"HELLO-{i}") for i in range(3)]
+            assert await server.async_send_batch("text_peer", msgs)
+            for i in range(3):
+                msg = await ws.receive_json(timeout=5)
+                assert msg["signal"] == TEST_PROTOCOL.ECHO_FLAG.value
+                assert msg["data"] == f"HELLO-{i}"
+
+
+async def test_client_send_msg_unique_ids(server, client, recorded_msgs):
+
+    # Back-to-back sends without an explicit id
+    await client._send_msg(signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO")
+    assert await client._send_msg(signal=TEST_PROTOCOL.ECHO_FLAG, data="HELLO", ok=True)
+    assert len({msg["uuid"] for msg in recorded_msgs}) == 2
 
 
 async def test_multiple_clients_send_to_server(server, client_list):
 
     for client in client_list:
-        await client.async_send(signal=TEST_PROTOCOL.ECHO_FLAG, data="ECHO!", ok=True)
+        assert await client.async_send(
+            signal=TEST_PROTOCOL.ECHO_FLAG, data="ECHO!", ok=True
+        )
 
-    assert await cpe.utils.async_waiting_for(
-        lambda: server.msg_processed_counter >= NUMBER_OF_CLIENTS,
-        timeout=5,
-    )
+    assert server.msg_processed_counter >= NUMBER_OF_CLIENTS
 
 
 async def test_server_broadcast_to_multiple_clients(server, client_list):
 
-    await server.async_broadcast(signal=TEST_PROTOCOL.ECHO_FLAG, data="ECHO!", ok=True)
+    # All the clients have handled the message once their OKs are back
+    assert await server.async_broadcast(
+        signal=TEST_PROTOCOL.ECHO_FLAG, data="ECHO!", ok=True
+    )
 
     for client in client_list:
-        assert await cpe.utils.async_waiting_for(
-            lambda: client.msg_processed_counter >= 2,
-            timeout=5,
-        )
+        assert client.msg_processed_counter >= 2
+
+
+@pytest.fixture
+def on_disk_zip():
+    # Folders above this size are zipped to a file instead of in memory
+    in_memory_zip_size = config.get("comms.in-memory-zip-size")
+    config.set("comms.in-memory-zip-size", 0)
+    yield
+    config.set("comms.in-memory-zip-size", in_memory_zip_size)
 
 
 @pytest.mark.parametrize(
@@ -174,9 +301,10 @@ async def test_server_broadcast_to_multiple_clients(server, client_list):
 async def test_client_sending_folder_to_server(server, client, dir):
 
     # Action
-    await client.async_send_folder(sender_id="test_worker", dir=dir)
+    assert await client.async_send_folder(sender_id="test_worker", dir=dir)
 
     # Also check that the file exists
+    assert server.file_transfer_records.records
     for record in server.file_transfer_records.records.values():
         assert record.location.exists()
 
@@ -184,3 +312,19 @@ async def test_client_sending_folder_to_server(server, client, dir):
     temp = pathlib.Path(tempfile.mkdtemp())
     await server.move_transferred_files(temp)
     await server.move_transferred_files(temp, owner="test_worker", owner_id="asdf")
+
+
+async def test_client_sending_folder_to_server_on_disk(on_disk_zip, server, client):
+
+    # Copy the folder, as the zip file is written next to it
+    dir = pathlib.Path(tempfile.mkdtemp()) / "simple_folder"
+    shutil.copytree(TEST_DIR / "mock" / "data" / "simple_folder", dir)
+
+    # Action
+    assert await client.async_send_folder(sender_id="test_worker", dir=dir)
+    assert (dir.parent / "simple_folder.zip").exists()
+
+    # Also check that the file exists
+    assert server.file_transfer_records.records
+    for record in server.file_transfer_records.records.values():
+        assert record.location.exists()
@@ -14,7 +14,6 @@ from chimerapy.engine.networking.publisher import Publisher
 from chimerapy.engine.networking.subscriber import Subscriber
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 
 @pytest.fixture
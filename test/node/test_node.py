@@ -20,7 +20,6 @@ from ..conftest import ConsumeNode, GenNode, linux_run_only
 from .test_worker_comms import mock_worker
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 # Constants
 CWD = pathlib.Path(os.path.abspath(__file__)).parent.parent
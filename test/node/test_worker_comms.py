@@ -1,11 +1,11 @@
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 
 import pytest
 from aiohttp import web
 
 import chimerapy.engine as cpe
 from chimerapy.engine.data_protocols import NodeDiagnostics, NodePubTable
-from chimerapy.engine.eventbus import EventBus
+from chimerapy.engine.eventbus import EventBus, make_evented
 from chimerapy.engine.networking.enums import NODE_MESSAGE, WORKER_MESSAGE
 from chimerapy.engine.networking.server import Server
 from chimerapy.engine.node.node_config import NodeConfig
@@ -54,6 +54,15 @@ class MockWorker:
         await self.server.async_shutdown()
 
 
+class StubClient:
+    def __init__(self):
+        self.sent: List[Tuple[Any, Dict]] = []
+
+    async def async_send(self, signal, data: Dict, ok: bool = False) -> bool:
+        self.sent.append((signal, data))
+        return True
+
+
 @pytest.fixture
 async def mock_worker():
     mock_worker = MockWorker()
@@ -147,3 +156,34 @@ async def test_ws_signals(worker_comms_setup, signal, data):
 
     # Shutdown
     await worker_comms.teardown()
+
+
+async def test_send_state_coalesces_changes():
+
+    # Evented state, so that changes trigger send_state through the eventbus
+    eventbus = EventBus()
+    state = make_evented(NodeState(id="test_worker_comms"), event_bus=eventbus)
+    worker_comms = WorkerCommsService(
+        "worker_comms",
+        host="",
+        port=0,
+        node_config=NodeConfig(),
+        state=state,
+        eventbus=eventbus,
+        logger=logger,
+    )
+    await worker_comms.async_init()
+    client = StubClient()
+    worker_comms.client = client
+
+    # A burst of changes within the same loop tick
+    fsms = ["INITIALIZED", "CONNECTED", "READY", "PREVIEWING"]
+    for fsm in fsms:
+        state.fsm = fsm
+
+    assert await cpe.utils.async_waiting_for(
+        lambda: len(client.sent) > 0 and client.sent[-1][1]["fsm"] == fsms[-1],
+        timeout=5,
+    )
+    assert all(signal == NODE_MESSAGE.STATUS for signal, _ in client.sent)
+    assert len(client.sent) < len(fsms)
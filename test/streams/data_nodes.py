@@ -28,10 +28,20 @@ class AudioNode(cpe.Node):
         self.format = format
         self.rate = rate
 
+    def setup(self):
+        self.rng = np.random.default_rng()
+        self.scratch = np.empty(self.chunk, dtype=np.float32)
+
     def step(self):
 
         time.sleep(1 / 20)
-        data = np.random.rand(self.chunk) * 2 - 1
+
+        # Noise in [-1, 1) as paInt16 samples. The saved array is queued by
+        # reference, so only the float scratch buffer is reused
+        self.rng.random(out=self.scratch, dtype=np.float32)
+        self.scratch *= 2 * 32767
+        self.scratch -= 32767
+        data = self.scratch.astype(np.int16)
         self.save_audio(
             name="test",
             data=data,
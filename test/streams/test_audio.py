@@ -1,5 +1,4 @@
 # Built-in Imports
-import asyncio
 import datetime
 import glob
 import os
@@ -92,13 +91,19 @@ def test_audio_record():
     # Create the record
     ar = AudioRecord(dir=TEST_DATA_DIR, name="test")
 
+    # Generate all the chunks at once, with a rising amplitude
+    n = int(RATE / CHUNK * RECORD_SECONDS)
+    rng = np.random.default_rng(0)
+    block = (rng.random((n, CHUNK), dtype=np.float32) * 2 - 1) * (
+        np.arange(n, dtype=np.float32)[:, None] * 0.1
+    )
+
     # Write to audio file
-    for i in range(0, int(RATE / CHUNK * RECORD_SECONDS)):
-        data = (np.random.rand(CHUNK) * 2 - 1) * (i * 0.1)
+    for i in range(n):
         audio_chunk = {
             "uuid": uuid.uuid4(),
             "name": "test",
-            "data": data,
+            "data": block[i],
             "dtype": "audio",
             "channels": CHANNELS,
             "format": FORMAT,
@@ -107,10 +112,37 @@ def test_audio_record():
             "timestamp": datetime.datetime.now(),
         }
         ar.write(audio_chunk)
+    ar.close()
 
     assert expected_audio_path.exists()
 
 
+def test_audio_record_writes_all_frames():
+    save_dir = pathlib.Path(tempfile.mkdtemp())
+    ar = AudioRecord(dir=save_dir, name="test")
+
+    # Enough chunks to cross the flush threshold and leave a remainder for close
+    chunk = np.zeros((CHUNK, CHANNELS), dtype=np.int16)
+    n = AudioRecord.FLUSH_SIZE // chunk.nbytes + 10
+    for _ in range(n):
+        audio_chunk = {
+            "uuid": uuid.uuid4(),
+            "name": "test",
+            "data": chunk,
+            "dtype": "audio",
+            "channels": CHANNELS,
+            "format": FORMAT,
+            "rate": RATE,
+            "recorder_version": 1,
+            "timestamp": datetime.datetime.now(),
+        }
+        ar.write(audio_chunk)
+    ar.close()
+
+    with wave.open(str(save_dir / "test.wav"), "rb") as f:
+        assert f.getnframes() == n * CHUNK
+
+
 async def test_node_save_audio_stream(audio_node):
 
     # Event Loop
@@ -118,10 +150,10 @@ async def test_node_save_audio_stream(audio_node):
 
     # Check that the audio was created
     expected_audio_path = pathlib.Path(audio_node.state.logdir) / "test.wav"
-    # try:
-    #     os.remove(expected_audio_path)
-    # except FileNotFoundError:
-    #     ...
+    try:
+        os.remove(expected_audio_path)
+    except FileNotFoundError:
+        ...
 
     # Stream
     await audio_node.arun(eventbus=eventbus)
@@ -131,11 +163,14 @@ async def test_node_save_audio_stream(audio_node):
     logger.debug("Finish start")
     await eventbus.asend(Event("record"))
     logger.debug("Finish record")
-    await asyncio.sleep(3)
+
+    # The file is created once the first chunk reaches the record
+    assert await cpe.utils.async_waiting_for(expected_audio_path.exists, timeout=5)
     await eventbus.asend(Event("stop"))
     logger.debug("Finish stop")
 
     await audio_node.ashutdown()
 
-    # Check that the audio was created
-    assert expected_audio_path.exists()
+    # Check that audio frames were recorded
+    with wave.open(str(expected_audio_path), "rb") as f:
+        assert f.getnframes() > 0
@@ -12,7 +12,6 @@ import chimerapy.engine as cpe
 from chimerapy.engine.networking.async_loop_thread import AsyncLoopThread
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 
 @pytest.fixture
@@ -1,4 +1,7 @@
 import asyncio
+import multiprocessing
+import pathlib
+import tempfile
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
@@ -14,8 +17,11 @@ from chimerapy.engine.eventbus import (
     evented,
     make_evented,
 )
+from chimerapy.engine.eventbus.observables import ObservableDict
 from chimerapy.engine.states import ManagerState, NodeState, WorkerState
 
+from .conftest import linux_run_only
+
 logger = cpe._logger.getLogger("chimerapy-engine")
 
 
@@ -283,6 +289,86 @@ def test_make_evented(cls, kwargs, event_bus):
     data.to_json()
 
 
+def test_make_evented_dict_cache(event_bus):
+    data = make_evented(
+        ManagerState(logdir=pathlib.Path(tempfile.mkdtemp())),
+        event_bus=event_bus,
+        cache_dict=True,
+    )
+    assert data.to_dict() == data.to_dict()
+
+    # Changes must clear the cache
+    data.port = 1000
+    assert data.to_dict()["port"] == 1000
+
+    data.workers["test"] = WorkerState(id="test", name="test")
+    assert "test" in data.to_dict()["workers"]
+
+    data.workers.clear()
+    assert data.to_dict()["workers"] == {}
+
+    # Changes in nested evented states must clear the parent's cache too
+    worker = make_evented(
+        WorkerState(id="test", name="test"),
+        event_bus=event_bus,
+        event_name="ManagerState.changed",
+        object=data,
+    )
+    data.workers["test"] = worker
+    assert data.to_dict()["workers"]["test"]["port"] == 0
+
+    worker.port = 2000
+    assert data.to_dict()["workers"]["test"]["port"] == 2000
+
+    worker.nodes["a"] = NodeState(id="a")
+    assert "a" in data.to_dict()["workers"]["test"]["nodes"]
+
+    data.workers.pop("test")
+    assert data.to_dict()["workers"] == {}
+
+    # Modifying the returned dict must not alter the cache
+    data.to_dict()["workers"]["test"] = {}
+    assert data.to_dict()["workers"] == {}
+
+
+def test_observable_dict_callbacks():
+    changes = []
+    data = ObservableDict({"a": 1})
+    data.set_callback(lambda key, value: changes.append(key))
+
+    # Every mutating method notifies
+    data.update({"b": 2}, c=3)
+    data.setdefault("d", 4)
+    data.pop("d")
+    data.popitem()
+    data.clear()
+    assert changes == ["b", "c", "d", "d", "c", None]
+
+    # Calls that change nothing do not notify
+    data["a"] = 1
+    changes.clear()
+    data.pop("missing", None)
+    data.setdefault("a", 2)
+    assert changes == []
+
+
+def _put_event_id(queue: multiprocessing.Queue):
+    queue.put(Event("child").id)
+
+
+@linux_run_only
+def test_event_ids_after_fork():
+    # A forked process must not reuse the parent's id prefix
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    p = ctx.Process(target=_put_event_id, args=(queue,))
+    p.start()
+    child_id = queue.get(timeout=10)
+    p.join()
+
+    assert child_id.split("-")[0] != Event("parent").id.split("-")[0]
+
+
 def test_make_evented_multiple(event_bus):
     # Create the evented class
     make_evented(SomeClass(number=1, string="hello"), event_bus=event_bus)
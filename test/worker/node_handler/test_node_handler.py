@@ -15,7 +15,6 @@ from ...networking.test_client_server import server
 from ...streams.data_nodes import ImageNode, TabularNode, VideoNode
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 
 # Constants
@@ -72,7 +71,7 @@ def node_with_reg_methods(logreceiver):
 
 
 @pytest.fixture
-async def node_handler_setup():
+async def node_handler_setup(logreceiver):
 
     # Event Loop
     eventbus = EventBus()
@@ -80,8 +79,6 @@ async def node_handler_setup():
     # Requirements
     state = make_evented(WorkerState(), event_bus=eventbus)
     logger = cpe._logger.getLogger("chimerapy-engine-worker")
-    log_receiver = cpe._logger.get_node_id_zmq_listener()
-    log_receiver.start(register_exit_handlers=True)
 
     # Create service
     node_handler = NodeHandlerService(
@@ -89,7 +86,7 @@ async def node_handler_setup():
         state=state,
         eventbus=eventbus,
         logger=logger,
-        logreceiver=log_receiver,
+        logreceiver=logreceiver,
     )
     await node_handler.async_init()
 
@@ -127,14 +124,22 @@ async def test_create_node_along_with_different_context(
     node_handler_setup, gen_node, con_node, context_order
 ):
     node_handler, _ = node_handler_setup
-    assert await node_handler.async_create_node(
-        cpe.NodeConfig(gen_node, context=context_order[0])
+    assert all(
+        await asyncio.gather(
+            node_handler.async_create_node(
+                cpe.NodeConfig(gen_node, context=context_order[0])
+            ),
+            node_handler.async_create_node(
+                cpe.NodeConfig(con_node, context=context_order[1])
+            ),
+        )
     )
-    assert await node_handler.async_create_node(
-        cpe.NodeConfig(con_node, context=context_order[1])
+    assert all(
+        await asyncio.gather(
+            node_handler.async_destroy_node(gen_node.id),
+            node_handler.async_destroy_node(con_node.id),
+        )
     )
-    assert await node_handler.async_destroy_node(gen_node.id)
-    assert await node_handler.async_destroy_node(con_node.id)
 
 
 @linux_run_only
@@ -195,7 +200,10 @@ async def test_starting_node(node_handler_setup, gen_node, context):
         cpe.NodeConfig(gen_node, context=context)
     )
     assert await node_handler.async_start_nodes()
-    await asyncio.sleep(1)
+    assert await cpe.utils.async_waiting_for(
+        lambda: node_handler.state.nodes[gen_node.id].fsm == "PREVIEWING",
+        timeout=5,
+    )
     assert await node_handler.async_stop_nodes()
     assert await node_handler.async_destroy_node(gen_node.id)
 
@@ -4,7 +4,6 @@ from ..networking.test_client_server import server
 from ..streams.data_nodes import AudioNode, ImageNode, TabularNode, VideoNode
 
 logger = cpe._logger.getLogger("chimerapy-engine")
-cpe.debug()
 
 
 # Constants